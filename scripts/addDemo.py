@@ -13,50 +13,56 @@ Compatible with Windows, macOS, and Linux.
 import os
 import sys
 import shutil
-import subprocess
 from pathlib import Path
 
+import createModule
+import removeModule
 
-def get_project_root() -> Path:
-    """Get the project root directory"""
-    script_dir = Path(__file__).parent
-    return script_dir.parent
+# Project root directory, resolved once at import
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
 
 
 def create_demo_module(project_root: Path) -> bool:
     """Create Demo module using createModule.py"""
-    create_script = project_root / "scripts" / "createModule.py"
-    
-    if not create_script.exists():
-        print(f"Error: createModule.py not found at {create_script}")
-        return False
-    
-    # Build command line arguments for Demo module
-    cmd = [
-        sys.executable, str(create_script),
+    substitutions = createModule.make_substitutions(
         "DEMO",  # module ID (must be uppercase)
-        "--name", "Demo Module",
-        "--description", "Demo module with example RNBO patch",
-        "--brand", "Example",
-        "--author", "Example Team",
-        "--email", "info@example.com",
-        "--website", "https://example.com"
-    ]
+        name="Demo Module",
+        description="Demo module with example RNBO patch",
+        brand="Example",
+        author="Example Team",
+        email="info@example.com",
+        website="https://example.com"
+    )
     
     print("Creating DEMO module...")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
-        
-        if result.returncode == 0:
-            print("Successfully created DEMO module")
-            return True
-        else:
-            print("Failed to create DEMO module:")
-            print(result.stderr)
-            return False
+        createModule.run(substitutions, project_root)
+    except SystemExit:
+        print("Failed to create DEMO module")
+        return False
     except Exception as e:
         print(f"Error creating DEMO module: {e}")
         return False
+    
+    print("Successfully created DEMO module")
+    return True
+
+
+def reflink_or_copy(src: str, dst: str) -> None:
+    """Copy a file with copy_file_range, which may share data blocks on reflink-capable filesystems"""
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        shutil.copystat(src, dst)
+    except OSError:
+        # copy_file_range may be refused, e.g. across filesystems.
+        # copy2 still copies in the kernel with sendfile
+        shutil.copy2(src, dst)
 
 
 def copy_demo_rnbo_code(project_root: Path) -> bool:
@@ -78,18 +84,12 @@ def copy_demo_rnbo_code(project_root: Path) -> bool:
     print(f"Copying demo RNBO code from {template_rnbo_dir} to {module_rnbo_dir}")
     
     try:
-        # Copy all files from template to module
-        for item in template_rnbo_dir.iterdir():
-            if item.is_file():
-                dest_file = module_rnbo_dir / item.name
-                shutil.copy2(item, dest_file)
-                print(f"  Copied: {item.name}")
-            elif item.is_dir():
-                dest_dir = module_rnbo_dir / item.name
-                if dest_dir.exists():
-                    shutil.rmtree(dest_dir)
-                shutil.copytree(item, dest_dir)
-                print(f"  Copied directory: {item.name}")
+        # Copy the whole tree, overwriting existing files (requires Python 3.8+).
+        # Without copy_file_range keep shutil's default copy2, which uses the
+        # native copy calls on macOS and Windows
+        copy_function = reflink_or_copy if hasattr(os, 'copy_file_range') else shutil.copy2
+        shutil.copytree(template_rnbo_dir, module_rnbo_dir, dirs_exist_ok=True,
+                        copy_function=copy_function)
         
         print("Successfully copied demo RNBO code")
         return True
@@ -155,30 +155,19 @@ Examples:
     
     args = parser.parse_args()
     
-    # Get project root
-    project_root = get_project_root()
+    project_root = PROJECT_ROOT
     
     # Check if DEMO already exists
     if check_demo_exists(project_root):
         if args.force:
             print("DEMO module already exists. Removing it first...")
-            remove_script = project_root / "scripts" / "removeModule.py"
-            if remove_script.exists():
-                try:
-                    result = subprocess.run([
-                        sys.executable, str(remove_script), "DEMO", "--force"
-                    ], capture_output=True, text=True, cwd=project_root)
-                    
-                    if result.returncode != 0:
-                        print("Failed to remove existing DEMO module:")
-                        print(result.stderr)
-                        sys.exit(1)
-                    print("Existing DEMO module removed successfully")
-                except Exception as e:
-                    print(f"Error removing existing DEMO module: {e}")
+            try:
+                if not removeModule.run("DEMO", project_root):
+                    print("Failed to remove existing DEMO module")
                     sys.exit(1)
-            else:
-                print(f"Error: removeModule.py not found at {remove_script}")
+                print("Existing DEMO module removed successfully")
+            except Exception as e:
+                print(f"Error removing existing DEMO module: {e}")
                 sys.exit(1)
         else:
             print("DEMO module already exists!")
@@ -45,8 +45,16 @@ class EnvironmentChecker:
     def check_command(self, command, version_arg="--version"):
         """Check if a command is available and return its version info"""
         try:
-            result = subprocess.run([command, version_arg], 
-                                  capture_output=True, text=True, timeout=10)
+            # A full executable path and close_fds=False let subprocess start
+            # the child with posix_spawn rather than fork/exec where available
+            executable = shutil.which(command)
+            if executable is None:
+                raise FileNotFoundError(command)
+            
+            # Only the first line of stdout is used, so stderr is not buffered
+            result = subprocess.run([executable, version_arg], 
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                  text=True, timeout=10, close_fds=False)
             if result.returncode == 0:
                 version = result.stdout.strip().split('\n')[0]
                 self.log_success(command + " found: " + version)
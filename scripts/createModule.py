@@ -16,8 +16,22 @@ import sys
 import shutil
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Pattern, Tuple
+
+# Project root directory, resolved once at import
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+# Placeholders substituted in the template files
+PLACEHOLDERS = ('__MOD__', '__NAME__', '__DESCRIPTION__', '__BRAND__',
+                '__AUTHOR__', '__EMAIL__', '__URL__')
+
+# Matches any placeholder, so each file is scanned once for all of them.
+# The shared '__' prefix is factored out so the regex engine searches for it
+# directly and only then branches on the placeholder name
+_PLACEHOLDER_RE = re.compile('__(?:' + '|'.join(re.escape(p[2:-2]) for p in PLACEHOLDERS) + ')__')
 
 
 def validate_module_id(module_id: str) -> bool:
@@ -47,6 +61,21 @@ def validate_module_id(module_id: str) -> bool:
     return True
 
 
+def make_substitutions(module_id: str, name: Optional[str] = None, description: Optional[str] = None,
+                       brand: Optional[str] = None, author: Optional[str] = None,
+                       email: Optional[str] = None, website: Optional[str] = None) -> Dict[str, str]:
+    """Build the placeholder substitutions for a module, filling in defaults"""
+    return {
+        '__MOD__': module_id,
+        '__NAME__': name or module_id,
+        '__DESCRIPTION__': description or name or module_id,
+        '__BRAND__': brand or "YourBrand",
+        '__AUTHOR__': author or "Unknown",
+        '__EMAIL__': email or "unknown@example.com",
+        '__URL__': website or "https://example.com"
+    }
+
+
 def collect_module_info(args: Optional[argparse.Namespace] = None) -> Dict[str, str]:
     """Collect module information from user or command line args"""
     
@@ -55,15 +84,8 @@ def collect_module_info(args: Optional[argparse.Namespace] = None) -> Dict[str,
         if not validate_module_id(args.module_id):
             sys.exit(1)
         
-        return {
-            '__MOD__': args.module_id,
-            '__NAME__': args.name or args.module_id,
-            '__DESCRIPTION__': args.description or args.name or args.module_id,
-            '__BRAND__': args.brand or "YourBrand",
-            '__AUTHOR__': args.author or "Unknown",
-            '__EMAIL__': args.email or "unknown@example.com",
-            '__URL__': args.website or "https://example.com"
-        }
+        return make_substitutions(args.module_id, args.name, args.description,
+                                  args.brand, args.author, args.email, args.website)
     
     # Interactive mode
     print("Creating new RNBO module for Percussa SSP/XMX")
@@ -94,24 +116,34 @@ def collect_module_info(args: Optional[argparse.Namespace] = None) -> Dict[str,
     }
 
 
-def substitute_in_file(file_path: Path, substitutions: Dict[str, str]) -> None:
-    """Perform placeholder substitution in a single file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Perform substitutions
-        for placeholder, value in substitutions.items():
-            content = content.replace(placeholder, value)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-            
-    except UnicodeDecodeError:
-        # Skip binary files
-        print(f"Skipping binary file: {file_path}")
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
+def substitute_in_file(src_path: Path, dst_path: Path, substitutions: Dict[str, str],
+                       pattern: Pattern[str] = _PLACEHOLDER_RE) -> None:
+    """Copy a single template file, performing placeholder substitution"""
+    # Sniff the first block for NUL bytes so binary files are never read in full
+    with open(src_path, 'rb') as f:
+        head = f.read(4096)
+        if b'\x00' in head:
+            print(f"Skipping binary file: {src_path}")
+            shutil.copy2(src_path, dst_path)
+            return
+        data = head + f.read()
+    
+    count = 0
+    
+    # Every placeholder starts with '__', so only decode files that contain it
+    if b'__' in data:
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Not UTF-8 text, copy as-is
+            print(f"Skipping binary file: {src_path}")
+        else:
+            # Perform all substitutions in a single pass
+            content, count = pattern.subn(lambda m: substitutions.get(m.group(0), m.group(0)), content)
+    
+    # Files without placeholders are written back unchanged
+    Path(dst_path).write_bytes(content.encode('utf-8') if count else data)
+    shutil.copystat(src_path, dst_path)
 
 
 def copy_and_substitute(template_dir: Path, target_dir: Path, substitutions: Dict[str, str]) -> None:
@@ -120,9 +152,35 @@ def copy_and_substitute(template_dir: Path, target_dir: Path, substitutions: Dic
         print(f"Error: Target directory {target_dir} already exists!")
         sys.exit(1)
     
-    # Copy template
+    # Copy template, substituting placeholders as each file is written.
+    # Directories are created first and the files processed in parallel
     print(f"Copying template from {template_dir} to {target_dir}")
-    shutil.copytree(template_dir, target_dir)
+    directories = []
+    files = []
+    for root, dirs, names in os.walk(template_dir, followlinks=True):
+        src_dir = Path(root)
+        dst_dir = target_dir / src_dir.relative_to(template_dir)
+        dst_dir.mkdir()
+        directories.append((src_dir, dst_dir))
+        files.extend((src_dir / name, dst_dir / name) for name in names)
+    
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        futures = [(src, dst, executor.submit(substitute_in_file, src, dst, substitutions, _PLACEHOLDER_RE))
+                   for src, dst in files]
+        for src, dst, future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                errors.append((str(src), str(dst), str(e)))
+    
+    # Copy directory metadata only once their files are written, deepest first,
+    # so read-only directories don't block the writes and mtimes are kept
+    for src_dir, dst_dir in reversed(directories):
+        shutil.copystat(src_dir, dst_dir)
+    
+    if errors:
+        raise shutil.Error(errors)
     
     # Create RNBO export directory structure
     module_id = substitutions['__MOD__']
@@ -130,12 +188,6 @@ def copy_and_substitute(template_dir: Path, target_dir: Path, substitutions: Dic
     rnbo_dir.mkdir(exist_ok=True)
     print(f"Created RNBO export directory: {rnbo_dir}")
     
-    # Perform substitutions in all files
-    for root, dirs, files in os.walk(target_dir):
-        for file in files:
-            file_path = Path(root) / file
-            substitute_in_file(file_path, substitutions)
-    
     print(f"Template copied and processed successfully")
 
 
@@ -178,6 +230,40 @@ def print_next_steps(module_id: str) -> None:
     print("\nFor more details, see docs/BUILDING.md")
 
 
+@lru_cache(maxsize=None)
+def get_project_dirs(project_root: Path) -> Tuple[Path, Path]:
+    """Locate the template and modules directories, validated once per project root"""
+    template_dir = project_root / "template" / "module"
+    modules_dir = project_root / "modules"
+    
+    # Validate directories exist
+    if not template_dir.exists():
+        print(f"Error: Template directory {template_dir} not found!")
+        sys.exit(1)
+    
+    if not modules_dir.exists():
+        print(f"Error: Modules directory {modules_dir} not found!")
+        sys.exit(1)
+    
+    return template_dir, modules_dir
+
+
+def run(substitutions: Dict[str, str], project_root: Path) -> None:
+    """Create a module from collected substitutions (exits on error)"""
+    template_dir, modules_dir = get_project_dirs(project_root)
+    
+    module_id = substitutions['__MOD__']
+    
+    # Create target directory
+    target_dir = modules_dir / module_id
+    
+    # Copy and process template
+    copy_and_substitute(template_dir, target_dir, substitutions)
+    
+    # Update CMakeLists.txt
+    update_modules_cmake(modules_dir, module_id)
+
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -207,37 +293,14 @@ Examples:
     
     args = parser.parse_args()
     
-    # Get project root directory
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    
-    template_dir = project_root / "template" / "module"
-    modules_dir = project_root / "modules"
-    
-    # Validate directories exist
-    if not template_dir.exists():
-        print(f"Error: Template directory {template_dir} not found!")
-        sys.exit(1)
-    
-    if not modules_dir.exists():
-        print(f"Error: Modules directory {modules_dir} not found!")
-        sys.exit(1)
-    
     # Collect information
     substitutions = collect_module_info(args)
-    module_id = substitutions['__MOD__']
     
-    # Create target directory
-    target_dir = modules_dir / module_id
-    
-    # Copy and process template
-    copy_and_substitute(template_dir, target_dir, substitutions)
-    
-    # Update CMakeLists.txt
-    update_modules_cmake(modules_dir, module_id)
+    # Create the module
+    run(substitutions, PROJECT_ROOT)
     
     # Print next steps
-    print_next_steps(module_id)
+    print_next_steps(substitutions['__MOD__'])
 
 
 if __name__ == "__main__":
@@ -13,18 +13,26 @@ Compatible with Windows, macOS, and Linux.
 import os
 import sys
 import shutil
+import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Set
+
+# Project root directory, resolved once at import
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+# Matches an add_subdirectory(<module>) line in CMakeLists.txt
+_ADD_SUBDIR_RE = re.compile(r'^\s*add_subdirectory\(([^)]+)\)\s*$')
 
 
 def list_available_modules(modules_dir: Path) -> List[str]:
     """List all available modules in the modules directory"""
-    modules = []
-    for item in modules_dir.iterdir():
-        if item.is_dir() and item.name not in ['common', 'inc', '.git']:
-            modules.append(item.name)
-    return sorted(modules)
+    # scandir reuses the entry type from the directory listing, avoiding a stat per entry
+    skip = {'common', 'inc', '.git'}
+    with os.scandir(modules_dir) as entries:
+        return sorted(entry.name for entry in entries
+                      if entry.is_dir(follow_symlinks=False) and entry.name not in skip)
 
 
 def confirm_removal(module_id: str, module_dir: Path, force: bool = False) -> bool:
@@ -63,37 +71,115 @@ def remove_module_directory(module_dir: Path, module_id: str) -> bool:
         return False
 
 
-def remove_from_cmake(cmake_file: Path, module_id: str) -> bool:
-    """Remove the add_subdirectory line from CMakeLists.txt"""
+def remove_entries_from_cmake(cmake_file: Path, module_ids: List[str]) -> Set[str]:
+    """Remove the add_subdirectory lines for several modules in one rewrite of CMakeLists.txt"""
     try:
         if not cmake_file.exists():
             print(f"Warning: CMakeLists.txt not found: {cmake_file}")
-            return False
-        
-        # Read current content
-        with open(cmake_file, 'r') as f:
-            lines = f.readlines()
+            return set()
         
-        # Find and remove the line
-        target_line = f"add_subdirectory({module_id})\n"
-        target_line_alt = f"add_subdirectory({module_id})"  # without newline
+        # Stream the content to a temporary file, then atomically replace the original.
+        # Resolve symlinks first so a linked CMakeLists.txt stays a link
+        cmake_file = cmake_file.resolve()
+        tmp_file = cmake_file.with_suffix('.txt.tmp')
+        remove_set = set(module_ids)
+        removed = set()
+        try:
+            with open(cmake_file, 'r') as rf, open(tmp_file, 'w') as wf:
+                for line in rf:
+                    # Find and remove the lines
+                    match = _ADD_SUBDIR_RE.match(line)
+                    module_id = match.group(1).strip() if match else None
+                    if module_id in remove_set:
+                        removed.add(module_id)
+                    else:
+                        wf.write(line)
+            
+            if removed:
+                shutil.copymode(cmake_file, tmp_file)
+                os.replace(tmp_file, cmake_file)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
         
-        original_count = len(lines)
-        lines = [line for line in lines if line.strip() != target_line.strip()]
+        for module_id in module_ids:
+            if module_id in removed:
+                print(f"Removed '{module_id}' from CMakeLists.txt")
+            else:
+                print(f"Warning: Module '{module_id}' was not found in CMakeLists.txt")
         
-        if len(lines) < original_count:
-            # Write back the modified content
-            with open(cmake_file, 'w') as f:
-                f.writelines(lines)
-            print(f"Removed '{module_id}' from CMakeLists.txt")
-            return True
-        else:
-            print(f"Warning: Module '{module_id}' was not found in CMakeLists.txt")
-            return False
+        return removed
             
     except Exception as e:
         print(f"Error updating CMakeLists.txt: {e}")
-        return False
+        return set()
+
+
+def remove_from_cmake(cmake_file: Path, module_id: str) -> bool:
+    """Remove the add_subdirectory line from CMakeLists.txt"""
+    return module_id in remove_entries_from_cmake(cmake_file, [module_id])
+
+
+def remove_directory_quietly(module_dir: Path) -> Optional[Exception]:
+    """Remove a directory tree, returning the error instead of printing it"""
+    try:
+        shutil.rmtree(module_dir)
+        return None
+    except Exception as e:
+        return e
+
+
+def batch_remove(module_ids: List[str], project_root: Path) -> int:
+    """Remove several modules without confirmation, returns the number fully removed"""
+    modules_dir = project_root / "modules"
+    cmake_file = modules_dir / "CMakeLists.txt"
+    
+    print(f"\nRemoving modules: {', '.join(module_ids)}")
+    
+    # Remove from CMakeLists.txt first (safer to fail here), in a single rewrite
+    removed_from_cmake = remove_entries_from_cmake(cmake_file, module_ids)
+    
+    # Remove directories in parallel
+    existing = [module_id for module_id in module_ids if (modules_dir / module_id).exists()]
+    with ThreadPoolExecutor() as executor:
+        errors = dict(zip(existing, executor.map(
+            remove_directory_quietly, [modules_dir / module_id for module_id in existing])))
+    
+    # Report results in order
+    success_count = 0
+    for module_id in module_ids:
+        module_dir = modules_dir / module_id
+        if module_id not in errors:
+            print(f"Warning: Module directory {module_dir} does not exist")
+        elif errors[module_id] is not None:
+            print(f"Error removing directory {module_dir}: {errors[module_id]}")
+        else:
+            print(f"Successfully removed directory for module '{module_id}'")
+            if module_id in removed_from_cmake:
+                success_count += 1
+    
+    return success_count
+
+
+def run(module_id: str, project_root: Path) -> bool:
+    """Remove a module without confirmation, returns True if fully removed"""
+    modules_dir = project_root / "modules"
+    cmake_file = modules_dir / "CMakeLists.txt"
+    module_dir = modules_dir / module_id
+    
+    print(f"\nRemoving module '{module_id}'...")
+    
+    success = True
+    
+    # Remove from CMakeLists.txt first (safer to fail here)
+    if not remove_from_cmake(cmake_file, module_id):
+        success = False
+    
+    # Remove directory
+    if not remove_module_directory(module_dir, module_id):
+        success = False
+    
+    return success
 
 
 def main():
@@ -125,11 +211,9 @@ WARNING: This operation is destructive and cannot be undone!
     
     args = parser.parse_args()
     
-    # Get project root directory
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    # Get project directories
+    project_root = PROJECT_ROOT
     modules_dir = project_root / "modules"
-    cmake_file = modules_dir / "CMakeLists.txt"
     
     # Validate directories exist
     if not modules_dir.exists():
@@ -191,17 +275,7 @@ WARNING: This operation is destructive and cannot be undone!
         sys.exit(0)
     
     # Perform removal
-    print(f"\nRemoving module '{module_id}'...")
-    
-    success = True
-    
-    # Remove from CMakeLists.txt first (safer to fail here)
-    if not remove_from_cmake(cmake_file, module_id):
-        success = False
-    
-    # Remove directory
-    if not remove_module_directory(module_dir, module_id):
-        success = False
+    success = run(module_id, project_root)
     
     # Summary
     if success:
@@ -5,31 +5,22 @@ removeAll.py - Remove all RNBO modules from Percussa SSP/XMX project
 This script removes all modules by:
 1. Finding all existing modules
 2. Confirming with the user (destructive operation)
-3. Using removeModule.py to remove each module
+3. Using removeModule.py to remove them all in one batch
 
 Compatible with Windows, macOS, and Linux.
 """
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 from typing import List
 
+# Project root directory, resolved once at import
+PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent.parent
 
-def get_project_root() -> Path:
-    """Get the project root directory"""
-    script_dir = Path(__file__).parent
-    return script_dir.parent.parent
-
-
-def list_available_modules(modules_dir: Path) -> List[str]:
-    """List all available modules in the modules directory"""
-    modules = []
-    for item in modules_dir.iterdir():
-        if item.is_dir() and item.name not in ['common', 'inc', '.git']:
-            modules.append(item.name)
-    return sorted(modules)
+# removeModule.py lives in the scripts directory
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+import removeModule
 
 
 def confirm_removal(modules: List[str], force: bool = False) -> bool:
@@ -58,30 +49,13 @@ def confirm_removal(modules: List[str], force: bool = False) -> bool:
 
 def remove_all_modules(modules: List[str], project_root: Path) -> bool:
     """Remove all modules using removeModule.py"""
-    remove_script = project_root / "scripts" / "removeModule.py"
-    
-    if not remove_script.exists():
-        print(f"Error: removeModule.py not found at {remove_script}")
-        return False
-    
-    success_count = 0
     total_count = len(modules)
     
-    for module in modules:
-        print(f"\nRemoving module '{module}'...")
-        try:
-            # Use the removeModule.py script with --force flag
-            result = subprocess.run([
-                sys.executable, str(remove_script), module, "--force"
-            ], capture_output=True, text=True, cwd=project_root)
-            
-            if result.returncode == 0:
-                print(f"Successfully removed '{module}'")
-                success_count += 1
-            else:
-                print(f"Failed to remove '{module}': {result.stderr}")
-        except Exception as e:
-            print(f"Error removing '{module}': {e}")
+    try:
+        success_count = removeModule.batch_remove(modules, project_root)
+    except Exception as e:
+        print(f"Error removing modules: {e}")
+        return False
     
     print(f"\nRemoval complete: {success_count}/{total_count} modules removed successfully")
     return success_count == total_count
@@ -112,7 +86,7 @@ WARNING: This operation is destructive and cannot be undone!
     args = parser.parse_args()
     
     # Get project directories
-    project_root = get_project_root()
+    project_root = PROJECT_ROOT
     modules_dir = project_root / "modules"
     
     # Validate directories exist
@@ -121,7 +95,7 @@ WARNING: This operation is destructive and cannot be undone!
         sys.exit(1)
     
     # List available modules
-    available_modules = list_available_modules(modules_dir)
+    available_modules = removeModule.list_available_modules(modules_dir)
     
     if not available_modules:
         print("No modules found to remove.")
@@ -4,62 +4,119 @@ test.py - Create test modules for development and testing
 
 This script creates test modules by:
 1. Creating two example modules with different configurations
-2. Using createModule.py to generate the modules
+2. Using createModule.py in-process to generate the modules
 3. Providing quick test data for development
 
 Compatible with Windows, macOS, and Linux.
 """
 
+import io
 import os
 import sys
-import subprocess
+import json
+import contextlib
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+# Parent scripts directory, where createModule.py lives, kept as a plain string
+_SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+sys.path.insert(0, _SCRIPTS_DIR)
+import createModule
+
+# Test module configurations, read-only so they can't be changed between runs
+_TEST_MODULES = tuple(MappingProxyType(config) for config in (
+    {
+        'id': 'TEST',
+        'name': 'Test Module',
+        'description': 'Basic test module for development',
+        'brand': 'TestBrand',
+        'author': 'Test Developer',
+        'email': 'test@example.com',
+        'website': 'https://test.example.com'
+    },
+    {
+        'id': 'VERB',
+        'name': 'Reverb Effect',
+        'description': 'Digital reverb processor with multiple algorithms',
+        'brand': 'AudioDev',
+        'author': 'Audio Engineer',
+        'email': 'audio@example.com',
+        'website': 'https://audiodev.example.com'
+    }
+))
+
+
+# Records the configuration a test module was created from, so reruns can skip it
+_CONFIG_FILE = ".module_config.json"
+
+# Build commands for this platform
+if os.name == 'nt':  # Windows
+    _BUILD_INSTRUCTIONS = "   mkdir build\n   cd build\n   cmake ..\n   cmake --build ."
+else:  # Unix-like (macOS, Linux)
+    _BUILD_INSTRUCTIONS = "   mkdir -p build && cd build\n   cmake ..\n   cmake --build ."
+
+
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Get the project root directory"""
-    script_dir = Path(__file__).parent
-    return script_dir.parent.parent
+    return Path(os.path.dirname(_SCRIPTS_DIR))
 
 
-def create_test_module(project_root: Path, module_config: dict) -> bool:
-    """Create a single test module using createModule.py"""
-    create_script = project_root / "scripts" / "createModule.py"
-    
-    if not create_script.exists():
-        print(f"Error: createModule.py not found at {create_script}")
-        return False
-    
-    # Build command line arguments
-    cmd = [
-        sys.executable, str(create_script),
-        module_config['id'],
-        "--name", module_config['name'],
-        "--description", module_config['description'],
-        "--brand", module_config['brand'],
-        "--author", module_config['author'],
-        "--email", module_config['email'],
-        "--website", module_config['website']
-    ]
+def last_error(output: str) -> str:
+    """Pick the last error message from createModule's output"""
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    errors = [line for line in lines if line.startswith("Error")]
+    if errors:
+        return errors[-1].split(": ", 1)[-1]
+    return lines[-1] if lines else "unknown error"
+
+
+def create_test_module(project_root: Path, module_config: Mapping[str, str]) -> Tuple[bool, str]:
+    """Create a single test module using createModule.py, returns success and a status line"""
+    module_id = module_config['id']
     
-    print(f"Creating test module '{module_config['id']}'...")
+    # createModule reports errors on stdout, so collect its output for the status line
+    log = io.StringIO()
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_root)
-        
-        if result.returncode == 0:
-            print(f"Successfully created module '{module_config['id']}'")
-            return True
-        else:
-            print(f"Failed to create module '{module_config['id']}':")
-            print(result.stderr)
-            return False
+        with contextlib.redirect_stdout(log):
+            if not createModule.validate_module_id(module_id):
+                return False, f"[{module_id}] FAIL: {last_error(log.getvalue())}"
+            
+            substitutions = createModule.make_substitutions(
+                module_id,
+                name=module_config['name'],
+                description=module_config['description'],
+                brand=module_config['brand'],
+                author=module_config['author'],
+                email=module_config['email'],
+                website=module_config['website']
+            )
+            
+            # Skip modules already created from the same configuration, making
+            # sure they are still registered in modules/CMakeLists.txt
+            modules_dir = project_root / "modules"
+            config_file = modules_dir / module_id / _CONFIG_FILE
+            config_json = json.dumps(dict(module_config), sort_keys=True)
+            if config_file.exists() and config_file.read_text(encoding='utf-8') == config_json:
+                createModule.update_modules_cmake(modules_dir, module_id)
+                return True, f"[{module_id}] SKIP (up-to-date)"
+            
+            createModule.run(substitutions, project_root)
+            config_file.write_text(config_json, encoding='utf-8')
+    except SystemExit:
+        return False, f"[{module_id}] FAIL: {last_error(log.getvalue())}"
     except Exception as e:
-        print(f"Error creating module '{module_config['id']}': {e}")
-        return False
+        return False, f"[{module_id}] FAIL: {e}"
+    
+    return True, f"[{module_id}] OK"
 
 
-def main():
-    """Main function"""
+@lru_cache(maxsize=None)
+def _get_parser():
+    """Build the command line parser once"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -84,68 +141,57 @@ Examples:
         """
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function"""
+    # No options besides --help, so only load argparse when arguments are given
+    # (it still handles --help and rejects unknown arguments)
+    if sys.argv[1:]:
+        _get_parser().parse_args()
     
     # Get project root
     project_root = get_project_root()
     
-    # Define test module configurations
-    test_modules = [
-        {
-            'id': 'TEST',
-            'name': 'Test Module',
-            'description': 'Basic test module for development',
-            'brand': 'TestBrand',
-            'author': 'Test Developer',
-            'email': 'test@example.com',
-            'website': 'https://test.example.com'
-        },
-        {
-            'id': 'VERB',
-            'name': 'Reverb Effect',
-            'description': 'Digital reverb processor with multiple algorithms',
-            'brand': 'AudioDev',
-            'author': 'Audio Engineer',
-            'email': 'audio@example.com',
-            'website': 'https://audiodev.example.com'
-        }
-    ]
-    
     print("Creating test modules for development...")
     print("=" * 50)
     
-    success_count = 0
-    total_count = len(test_modules)
+    total_count = len(_TEST_MODULES)
     
-    for module_config in test_modules:
-        if create_test_module(project_root, module_config):
-            success_count += 1
-        print()  # Empty line for readability
+    # Validate the project layout once, before creating any module
+    createModule.get_project_dirs(project_root)
     
-    # Summary
-    print("=" * 50)
-    print(f"Test module creation complete: {success_count}/{total_count} modules created successfully")
+    # Create the modules one at a time, so modules/CMakeLists.txt is updated in
+    # configuration order (createModule already copies each module's files in
+    # parallel)
+    results = [create_test_module(project_root, config) for config in _TEST_MODULES]
+    
+    success_count = sum(1 for success, _ in results if success)
+    
+    # One status line per module, plus an empty line for readability
+    sys.stdout.write("".join(f"{status}\n" for _, status in results) + "\n")
+    
+    # Summary, written in one go
+    out = ["=" * 50,
+           f"Test module creation complete: {success_count}/{total_count} modules created successfully"]
     
     if success_count == total_count:
-        print("\nTest modules created successfully!")
-        print("\nNext steps:")
-        print("1. Export RNBO code to:")
-        print("   - modules/TEST/TEST-rnbo/")
-        print("   - modules/VERB/VERB-rnbo/")
-        print("\n2. Build the modules:")
-        if os.name == 'nt':  # Windows
-            print("   mkdir build")
-            print("   cd build")
-            print("   cmake ..")
-            print("   cmake --build .")
-        else:  # Unix-like (macOS, Linux)
-            print("   mkdir -p build && cd build")
-            print("   cmake ..")
-            print("   cmake --build .")
-        print("\n3. Clean up test modules when done:")
-        print("   python scripts/test/removeAll.py --force")
+        out += ["\nTest modules created successfully!",
+                "\nNext steps:",
+                "1. Export RNBO code to:",
+                "   - modules/TEST/TEST-rnbo/",
+                "   - modules/VERB/VERB-rnbo/",
+                "\n2. Build the modules:",
+                _BUILD_INSTRUCTIONS,
+                "\n3. Clean up test modules when done:",
+                "   python scripts/test/removeAll.py --force"]
     else:
-        print("\nSome test modules could not be created. Please check the errors above.")
+        out.append("\nSome test modules could not be created. Please check the errors above.")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    if success_count != total_count:
         sys.exit(1)
 
 